@@ -8,46 +8,76 @@ different modes and configurations.
 
 import sys
 import os
-import subprocess
+import re
+
+_SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'regional_settings_reset.py'))
+
+sys.path.insert(0, os.path.dirname(_SCRIPT_PATH))
+
+_BANNER = (
+    "Windows Regional Settings Reset - Python Edition v2.0\n"
+    + "=" * 55 + "\n"
+    "\n"
+    "Launch Options:\n"
+    "1. Interactive Menu (Recommended)\n"
+    "2. Quick Reset (pl-PL)\n"
+    "3. Command Line Mode\n"
+    "4. Help & Usage\n"
+    "5. Exit\n"
+    "\n"
+)
+
+# Locale tags are checked here so typos never reach the application
+_LOCALE_RE = re.compile(r'^[A-Za-z]{2,3}-[A-Za-z]{2}$')
+
+# Menu options that map directly onto application arguments
+_DISPATCH = {
+    '1': ('--menu',),              # Interactive menu
+    '2': ('--locale', 'pl-PL'),    # Quick reset
+}
+
+def _app_module():
+    """Import the main application on first use so Exit skips its import cost"""
+    import regional_settings_reset
+    return regional_settings_reset
+
+def run_reset(*extra):
+    """Run the main application in-process with the given arguments"""
+    saved_argv = sys.argv
+    sys.argv = [_SCRIPT_PATH, *extra]
+    try:
+        _app_module().main()
+    finally:
+        sys.argv = saved_argv
 
 def main():
     """Main launcher function"""
-    script_path = os.path.join(os.path.dirname(__file__), 'regional_settings_reset.py')
-    
-    print("Windows Regional Settings Reset - Python Edition v2.0")
-    print("=" * 55)
-    print()
-    print("Launch Options:")
-    print("1. Interactive Menu (Recommended)")
-    print("2. Quick Reset (pl-PL)")
-    print("3. Command Line Mode")
-    print("4. Help & Usage")
-    print("5. Exit")
-    print()
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
     
     try:
         choice = input("Select option (1-5): ").strip()
         
-        if choice == '1':
-            # Interactive menu
-            subprocess.run([sys.executable, script_path, '--menu'])
-        elif choice == '2':
-            # Quick reset
-            subprocess.run([sys.executable, script_path, '--locale', 'pl-PL'])
+        extra = _DISPATCH.get(choice)
+        
+        if extra is not None:
+            run_reset(*extra)
         elif choice == '3':
             # Command line mode
             locale = input("Enter locale (e.g., en-US): ").strip()
-            if locale:
-                args = [sys.executable, script_path, '--locale', locale]
+            if not locale:
+                print("No locale specified.")
+            elif not _LOCALE_RE.match(locale):
+                print(f"Invalid locale: {locale}")
+            else:
+                args = ['--locale', locale]
                 force = input("Force mode? (y/N): ").strip().lower()
                 if force == 'y':
                     args.append('--force')
-                subprocess.run(args)
-            else:
-                print("No locale specified.")
+                run_reset(*args)
         elif choice == '4':
             # Help
-            subprocess.run([sys.executable, script_path, '--help'])
+            _app_module().build_parser().print_help()
         elif choice == '5':
             # Exit
             print("Goodbye!")
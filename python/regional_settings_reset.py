@@ -16,16 +16,23 @@ import sys
 import json
 import logging
 import argparse
-import subprocess
 import tempfile
-import shutil
+import io
 import re
+import time
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
+
+# Interpreter details shown on several screens; fixed for the process lifetime
+_PYVER = sys.version.split()[0]
+_PLATFORM = sys.platform
 
 # Windows-specific imports with fallbacks
-if sys.platform == 'win32':
+if _PLATFORM == 'win32':
     try:
         import winreg
         import ctypes
@@ -40,32 +47,50 @@ else:
     winreg = None
     ctypes = None
     
+# Optional faster JSON parser with stdlib fallback
+try:
+    import orjson as fast_json
+except ImportError:
+    fast_json = json
+    
 # Mock objects for non-Windows platforms
 if not WINDOWS_AVAILABLE:
     class MockWinreg:
         HKEY_CURRENT_USER = "HKEY_CURRENT_USER"
         REG_SZ = 1
+        REG_EXPAND_SZ = 2
+        REG_BINARY = 3
         REG_DWORD = 4
+        REG_MULTI_SZ = 7
+        REG_QWORD = 11
+        KEY_QUERY_VALUE = 0x0001
+        KEY_SET_VALUE = 0x0002
+        KEY_READ = 0x20019
         
         @staticmethod
         def CreateKey(*args):
             raise NotImplementedError("Windows registry not available on this platform")
             
+        @staticmethod
+        def CreateKeyEx(*args):
+            raise NotImplementedError("Windows registry not available on this platform")
+            
         @staticmethod
         def OpenKey(*args):
             raise NotImplementedError("Windows registry not available on this platform")
             
         @staticmethod
-        def SetValueEx(*args):
+        def OpenKeyEx(*args):
             raise NotImplementedError("Windows registry not available on this platform")
             
         @staticmethod
-        def QueryValueEx(*args):
+        def SetValueEx(*args):
             raise NotImplementedError("Windows registry not available on this platform")
             
         @staticmethod
-        def DeleteTree(*args):
+        def QueryValueEx(*args):
             raise NotImplementedError("Windows registry not available on this platform")
+            
     
     winreg = MockWinreg()
     
@@ -79,11 +104,241 @@ if not WINDOWS_AVAILABLE:
     ctypes = MockCtypes()
 
 # Check if running on Windows
-if sys.platform != 'win32':
+if _PLATFORM != 'win32':
     print("⚠️  WARNING: This application is designed for Windows systems.")
-    print("   Current platform:", sys.platform)
+    print("   Current platform:", _PLATFORM)
     print("   Running in demonstration mode with limited functionality.\n")
 
+# Characters stripped from user input by _sanitize_input
+_SANITIZE_DELETE = str.maketrans('', '', ';&|`$\n\r')
+
+# Precompiled patterns used on hot paths
+_BACKUP_TS_RE = re.compile(r'(\d{8})_(\d{6})')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f]')
+
+def _format_reg_value(name: str, data: Any, value_type: int) -> str:
+    """Format a registry value as a line of a .reg file"""
+    if name:
+        escaped_name = name.replace('\\', '\\\\').replace('"', '\\"')
+        entry = f'"{escaped_name}"'
+    else:
+        entry = '@'
+    
+    if value_type == winreg.REG_DWORD:
+        return f"{entry}=dword:{data & 0xFFFFFFFF:08x}"
+        
+    # Strings with line breaks or other control characters cannot be quoted
+    # on a single line, so reg export writes them as hex(1) like other types
+    if value_type == winreg.REG_SZ and not _CONTROL_CHARS_RE.search(str(data)):
+        escaped_data = str(data).replace('\\', '\\\\').replace('"', '\\"')
+        return f'{entry}="{escaped_data}"'
+        
+    # Remaining types are written as raw hex bytes
+    if value_type in (winreg.REG_SZ, winreg.REG_EXPAND_SZ):
+        raw = (str(data) + "\0").encode("utf-16-le")
+    elif value_type == winreg.REG_MULTI_SZ:
+        raw = ("".join(item + "\0" for item in data) + "\0").encode("utf-16-le")
+    elif value_type == winreg.REG_QWORD:
+        raw = data.to_bytes(8, "little")
+    else:
+        raw = bytes(data or b"")
+        
+    prefix = "hex" if value_type == winreg.REG_BINARY else f"hex({value_type:x})"
+    return f"{entry}={prefix}:" + ",".join(f"{byte:02x}" for byte in raw)
+
+# Registry hive names accepted in registry paths
+_REG_HIVE_ALIASES = {
+    "HKCU": "HKEY_CURRENT_USER",
+    "HKLM": "HKEY_LOCAL_MACHINE",
+    "HKCR": "HKEY_CLASSES_ROOT",
+    "HKU": "HKEY_USERS",
+    "HKCC": "HKEY_CURRENT_CONFIG"
+}
+
+def _split_registry_path(registry_path: str) -> Tuple[str, int, str]:
+    """Split a registry path into its hive name, hive handle and subkey"""
+    hive_name, _, subkey = registry_path.partition("\\")
+    hive_name = _REG_HIVE_ALIASES.get(hive_name.upper(), hive_name.upper())
+    hive = getattr(winreg, hive_name, None)
+    if not hive_name.startswith("HKEY_") or hive is None:
+        raise ValueError(f"Unknown registry hive: {hive_name}")
+    return hive_name, hive, subkey
+
+def _append_reg_key(lines: List[str], hive: int, subkey: str, path: str):
+    """Append a registry key and its subkeys in .reg file format"""
+    with winreg.OpenKeyEx(hive, subkey, 0, winreg.KEY_READ) as key:
+        subkey_count, value_count, _ = winreg.QueryInfoKey(key)
+        lines.append(f"[{path}]")
+        for i in range(value_count):
+            name, data, value_type = winreg.EnumValue(key, i)
+            lines.append(_format_reg_value(name, data, value_type))
+        lines.append("")
+        children = [winreg.EnumKey(key, i) for i in range(subkey_count)]
+        
+    for child in children:
+        _append_reg_key(lines, hive, f"{subkey}\\{child}", f"{path}\\{child}")
+
+def _write_reg_file(file_or_fd, lines: List[str]):
+    """Write .reg file body lines under the version header (path or open descriptor)"""
+    # reg.exe expects UTF-16 with BOM and CRLF line endings
+    with open(file_or_fd, 'w', encoding='utf-16', newline='\r\n') as f:
+        f.write("\n".join(["Windows Registry Editor Version 5.00", "", *lines]))
+
+def _export_registry_key(registry_path: str, dest_path: str):
+    """Export a registry key to a .reg file in-process (equivalent to reg export)"""
+    hive_name, hive, subkey = _split_registry_path(registry_path)
+    lines = []
+    _append_reg_key(lines, hive, subkey, f"{hive_name}\\{subkey}" if subkey else hive_name)
+    _write_reg_file(dest_path, lines)
+
+def _set_registry_value_direct(hive: int, key_path: str, value_name: str, value_type: int, value_data: Any):
+    """Set a registry value with a single RegSetKeyValueW call (creates the key if missing)"""
+    if value_type == winreg.REG_DWORD:
+        data = ctypes.c_uint32(value_data & 0xFFFFFFFF)
+    elif value_type == winreg.REG_SZ:
+        data = ctypes.create_unicode_buffer(str(value_data))
+    else:
+        # Other value types are marshalled by winreg
+        with winreg.CreateKeyEx(hive, key_path, 0, winreg.KEY_SET_VALUE) as key:
+            winreg.SetValueEx(key, value_name, 0, value_type, value_data)
+        return
+        
+    error = ctypes.windll.advapi32.RegSetKeyValueW(
+        ctypes.c_void_p(hive), key_path, value_name, value_type,
+        ctypes.byref(data), ctypes.sizeof(data)
+    )
+    if error:
+        raise ctypes.WinError(error)
+
+if WINDOWS_AVAILABLE:
+    class _VALENTW(ctypes.Structure):
+        """Value entry for RegQueryMultipleValuesW"""
+        _fields_ = [
+            ("ve_valuename", ctypes.c_wchar_p),
+            ("ve_valuelen", wintypes.DWORD),
+            ("ve_valueptr", ctypes.c_size_t),
+            ("ve_type", wintypes.DWORD)
+        ]
+
+def _query_multiple_values(key, value_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Read several values of an open key with one RegQueryMultipleValuesW call"""
+    entries = (_VALENTW * len(value_names))()
+    for entry, name in zip(entries, value_names):
+        entry.ve_valuename = name
+        
+    buf_size = wintypes.DWORD(1024)
+    while True:
+        buf = ctypes.create_string_buffer(buf_size.value)
+        error = ctypes.windll.advapi32.RegQueryMultipleValuesW(
+            ctypes.c_void_p(key.handle), entries, len(value_names), buf, ctypes.byref(buf_size)
+        )
+        if error != 234:  # ERROR_MORE_DATA, buf_size now holds the required size
+            break
+            
+    if error:
+        raise ctypes.WinError(error)
+        
+    values = {}
+    for entry, name in zip(entries, value_names):
+        if entry.ve_type == winreg.REG_DWORD:
+            values[name] = ctypes.c_uint32.from_address(entry.ve_valueptr).value
+        else:
+            values[name] = ctypes.wstring_at(entry.ve_valueptr, entry.ve_valuelen // 2).rstrip('\0')
+    return values
+
+def _read_values(key, value_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Read several values of an open key; missing values are returned as None"""
+    try:
+        return _query_multiple_values(key, value_names)
+    except OSError:
+        # The batched read fails as a whole if any value is missing
+        values = {}
+        for name in value_names:
+            try:
+                values[name], _ = winreg.QueryValueEx(key, name)
+            except FileNotFoundError:
+                values[name] = None
+        return values
+
+def _enable_virtual_terminal():
+    """Enable ANSI escape sequence processing on the Windows console"""
+    if not WINDOWS_AVAILABLE:
+        return
+        
+    try:
+        # Private instance so the prototypes below do not affect ctypes.windll users
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.GetStdHandle.argtypes = (wintypes.DWORD,)
+        kernel32.GetStdHandle.restype = wintypes.HANDLE
+        kernel32.GetConsoleMode.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD))
+        kernel32.GetConsoleMode.restype = wintypes.BOOL
+        kernel32.SetConsoleMode.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+        kernel32.SetConsoleMode.restype = wintypes.BOOL
+        
+        handle = kernel32.GetStdHandle(-11 & 0xFFFFFFFF)  # STD_OUTPUT_HANDLE
+        if not handle or handle == wintypes.HANDLE(-1).value:  # INVALID_HANDLE_VALUE
+            return
+            
+        mode = wintypes.DWORD()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception:
+        pass
+
+@lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON configuration file (cached per path and modification time).
+    
+    The returned dict is shared between callers and must not be modified.
+    """
+    return fast_json.loads(Path(path).read_bytes())
+
+@contextmanager
+def _buffered_output():
+    """Collect everything printed inside the block and write it to stdout at once"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+def _read_key(prompt: str) -> str:
+    """Read a single keypress without waiting for Enter"""
+    if not sys.stdin.isatty():
+        return input(prompt)
+        
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getwch()
+        # Discard keys typed after the choice (e.g. a habitual Enter) so they
+        # are not read as the answer to the next prompt
+        while msvcrt.kbhit():
+            msvcrt.getwch()
+    else:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        saved_attrs = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            # Read from the descriptor directly; sys.stdin would buffer the
+            # following keys out of reach of the flush below
+            key = os.read(fd, 1).decode('utf-8', errors='replace')
+        finally:
+            # TCSAFLUSH also discards pending input such as a habitual Enter
+            termios.tcsetattr(fd, termios.TCSAFLUSH, saved_attrs)
+            
+    if key == '\x03':  # Ctrl+C is not turned into a signal by getwch
+        raise KeyboardInterrupt
+        
+    sys.stdout.write((key if key.isprintable() else "") + "\n")
+    return key
+
 class Colors:
     """ANSI color codes for console output"""
     RED = '\033[91m'
@@ -96,11 +351,131 @@ class Colors:
     GRAY = '\033[90m'
     RESET = '\033[0m'
     BOLD = '\033[1m'
+    CLEAR_SCREEN = '\033[2J\033[H'
+    
+    # Precomputed log line prefixes
+    WARN_PREFIX = f"{YELLOW}[WARNING] "
+    ERROR_PREFIX = f"{RED}[ERROR] "
+    SUCCESS_PREFIX = f"{GREEN}[SUCCESS] "
+
+_STATS_TEMPLATE = f"""
+{Colors.CYAN}Execution Statistics:{Colors.RESET}
+  Total Operations: {{operations}}
+  Successful: {Colors.GREEN}{{successes}}{Colors.RESET}
+  Failed: {Colors.RED}{{errors}}{Colors.RESET}
+  Success Rate: {Colors.BLUE}{{success_rate:.1f}}%{Colors.RESET}
+  
+{Colors.CYAN}Files:{Colors.RESET}
+  Log File: {Colors.WHITE}{{log_file}}{Colors.RESET}
+  Backup Directory: {Colors.WHITE}{{backup_path}}{Colors.RESET}
+"""
+
+# "Label: value" lines used by the information screens
+_LABEL_FMT = f"{Colors.CYAN}%s:{Colors.RESET} {Colors.WHITE}%s{Colors.RESET}"
+_LABEL_NOT_SET_FMT = f"{Colors.CYAN}%s:{Colors.RESET} {Colors.GRAY}Not set{Colors.RESET}"
+
+# Static screens of the interactive menu, rendered once at import
+_HELP_EXAMPLES = (
+    ("Quick Reset", "Use option 1 for immediate reset with current locale"),
+    ("Change Locale", "Use option 2 to select different locale"),
+    ("Backup First", "Always create backup before making changes"),
+    ("Check Status", "Use option 5 to view current settings"),
+    ("Admin Required", "Most operations require administrator privileges"),
+    ("Configuration", "Use config.json for advanced settings")
+)
+
+_HELP_TEXT = "\n".join([
+    f"\n{Colors.YELLOW}Help & Examples{Colors.RESET}",
+    "=" * 25,
+    *(f"{Colors.CYAN}• {title}:{Colors.RESET} {desc}" for title, desc in _HELP_EXAMPLES),
+    f"\n{Colors.CYAN}Command Line Usage:{Colors.RESET}",
+    "python regional_settings_reset.py --locale en-US --force",
+    "python regional_settings_reset.py --config config.json",
+    "python regional_settings_reset.py --help",
+    ""
+])
+
+_ABOUT_FEATURES = (
+    "Interactive menu system",
+    "Comprehensive regional settings reset",
+    "Backup and restore functionality",
+    "Multiple locale support",
+    "Configuration management",
+    "System validation tools"
+)
+
+_ABOUT_TEXT = "\n".join([
+    f"\n{Colors.YELLOW}About{Colors.RESET}",
+    "=" * 15,
+    f"{Colors.CYAN}Windows Regional Settings Reset - Python Edition{Colors.RESET}",
+    f"Version: {Colors.WHITE}2.0{Colors.RESET}",
+    f"License: {Colors.WHITE}MIT{Colors.RESET}",
+    f"Platform: {Colors.WHITE}Windows 10/11{Colors.RESET}",
+    f"Python: {Colors.WHITE}{_PYVER}+{Colors.RESET}",
+    f"\n{Colors.CYAN}Features:{Colors.RESET}",
+    *(f"• {feature}" for feature in _ABOUT_FEATURES),
+    ""
+])
+
+# Registry values applied for each fully specified locale
+_LOCALE_CONFIGS = MappingProxyType({
+    "pl-PL": MappingProxyType({
+        "Locale": "pl-PL",
+        "LocaleName": "pl-PL",
+        "sLanguage": "PLK",
+        "sCountry": "Poland",
+        "sShortDate": "dd.MM.yyyy",
+        "sLongDate": "d MMMM yyyy",
+        "sTimeFormat": "HH:mm:ss",
+        "sShortTime": "HH:mm",
+        "sCurrency": "zł",
+        "sMonDecimalSep": ",",
+        "sMonThousandSep": " ",
+        "sDecimal": ",",
+        "sThousand": " ",
+        "sList": ";",
+        "iCountry": 48,
+        "iCurrency": 3,
+        "iCurrDigits": 2,
+        "iDate": 1,
+        "iTime": 1,
+        "iTLZero": 1,
+        "s1159": "",
+        "s2359": ""
+    }),
+    "en-US": MappingProxyType({
+        "Locale": "en-US",
+        "LocaleName": "en-US",
+        "sLanguage": "ENU",
+        "sCountry": "United States",
+        "sShortDate": "M/d/yyyy",
+        "sLongDate": "dddd, MMMM d, yyyy",
+        "sTimeFormat": "h:mm:ss tt",
+        "sShortTime": "h:mm tt",
+        "sCurrency": "$",
+        "sMonDecimalSep": ".",
+        "sMonThousandSep": ",",
+        "sDecimal": ".",
+        "sThousand": ",",
+        "sList": ",",
+        "iCountry": 1,
+        "iCurrency": 0,
+        "iCurrDigits": 2,
+        "iDate": 0,
+        "iTime": 0,
+        "iTLZero": 0,
+        "s1159": "AM",
+        "s2359": "PM"
+    })
+    # Add more locales as needed
+})
 
 class RegionalSettingsConfig:
     """Configuration management for regional settings"""
     
-    SUPPORTED_LOCALES = {
+    # Locale tables and defaults are read-only views so instances can share
+    # them without defensive copies
+    SUPPORTED_LOCALES = MappingProxyType({
         "pl-PL": "Polish (Poland)",
         "en-US": "English (United States)",
         "en-GB": "English (United Kingdom)",
@@ -113,12 +488,18 @@ class RegionalSettingsConfig:
         "zh-CN": "Chinese (Simplified, China)",
         "ja-JP": "Japanese (Japan)",
         "ko-KR": "Korean (Korea)"
-    }
+    })
+    
+    # Ordered (code, name) pairs for menus and listings
+    LOCALES_ITEMS = tuple(SUPPORTED_LOCALES.items())
+    
+    # Locale codes alone, for membership checks
+    SUPPORTED_LOCALE_CODES = frozenset(SUPPORTED_LOCALES)
     
     # Cached locale settings to avoid recreation (performance optimization)
     LOCALE_SETTINGS_CACHE = {}
     
-    GEO_IDS = {
+    GEO_IDS = MappingProxyType({
         "pl-PL": 191,
         "en-US": 244,
         "en-GB": 242,
@@ -131,26 +512,30 @@ class RegionalSettingsConfig:
         "zh-CN": 45,
         "ja-JP": 122,
         "ko-KR": 134
-    }
+    })
     
-    DEFAULT_CONFIG = {
+    DEFAULT_CONFIG = MappingProxyType({
         "defaultLocale": "pl-PL",
         "skipBackup": False,
         "maxRetries": 3,
+        "verifyWrites": False,
         "logLevel": "INFO",
-        "features": {
+        "features": MappingProxyType({
             "resetBrowserSettings": True,
             "resetOfficeSettings": True,
             "resetMruLists": True,
             "resetSystemLocale": True,
             "resetWindows11Memory": True
-        },
-        "backup": {
+        }),
+        "backup": MappingProxyType({
             "retentionDays": 30,
             "compressionEnabled": False,
             "customBackupPath": ""
-        }
-    }
+        })
+    })
+
+# Default configuration file contents, serialized once at import
+_DEFAULT_CONFIG_JSON = json.dumps(RegionalSettingsConfig.DEFAULT_CONFIG, indent=2, default=dict).encode('utf-8')
 
 class RegionalSettingsReset:
     """Main class for Windows Regional Settings Reset functionality"""
@@ -193,8 +578,7 @@ class RegionalSettingsReset:
         if not user_input:
             return ""
         # Remove potentially dangerous characters
-        sanitized = re.sub(r'[;&|`$\n\r]', '', user_input)
-        return sanitized[:max_length]
+        return user_input.translate(_SANITIZE_DELETE)[:max_length]
         
     def _setup_logging(self, log_file: Optional[str] = None):
         """Setup logging configuration"""
@@ -207,14 +591,16 @@ class RegionalSettingsReset:
         self.log_file = log_file
         
         # Create log directory if it doesn't exist
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        log_dir = os.path.dirname(log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
         
-        # Configure logging
+        # Configure logging (the log file is only opened on the first record)
         logging.basicConfig(
             level=logging.INFO,
             format='[%(asctime)s] [%(levelname)s] %(message)s',
             handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
+                logging.FileHandler(log_file, encoding='utf-8', delay=True),
                 logging.StreamHandler(sys.stdout)
             ]
         )
@@ -223,13 +609,13 @@ class RegionalSettingsReset:
         
     def _load_config(self, config_file: Optional[str] = None):
         """Load configuration from file or use defaults"""
-        self.user_config = self.config.DEFAULT_CONFIG.copy()
+        # Share the read-only defaults unless a user configuration is merged in
+        self.user_config = self.config.DEFAULT_CONFIG
         
         if config_file and os.path.exists(config_file):
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    self.user_config.update(loaded_config)
+                loaded_config = _load_config_file(config_file, os.path.getmtime(config_file))
+                self.user_config = {**self.config.DEFAULT_CONFIG, **loaded_config}
                 self.log_info(f"Configuration loaded from: {config_file}")
             except Exception as e:
                 self.log_warning(f"Failed to load configuration from {config_file}: {e}")
@@ -247,26 +633,34 @@ class RegionalSettingsReset:
     def log_info(self, message: str, color: str = Colors.WHITE):
         """Log info message with color"""
         self.logger.info(message)
-        if color != Colors.WHITE:
-            print(f"{color}{message}{Colors.RESET}")
+        # Identity check: the default color is always the Colors.WHITE object
+        if color is not Colors.WHITE:
+            sys.stdout.write(color + message + Colors.RESET + "\n")
             
     def log_warning(self, message: str):
         """Log warning message"""
         self.logger.warning(message)
-        print(f"{Colors.YELLOW}[WARNING] {message}{Colors.RESET}")
+        print(Colors.WARN_PREFIX + message + Colors.RESET)
         
     def log_error(self, message: str):
         """Log error message"""
         self.logger.error(message)
-        print(f"{Colors.RED}[ERROR] {message}{Colors.RESET}")
+        print(Colors.ERROR_PREFIX + message + Colors.RESET)
         self.error_count += 1
         
     def log_success(self, message: str):
         """Log success message"""
         self.logger.info(message)
-        print(f"{Colors.GREEN}[SUCCESS] {message}{Colors.RESET}")
+        print(Colors.SUCCESS_PREFIX + message + Colors.RESET)
         self.success_count += 1
         
+    def reset_statistics(self):
+        """Reset operation counters and backup location before a new action"""
+        self.operation_count = 0
+        self.success_count = 0
+        self.error_count = 0
+        self.backup_path = ""
+        
     def print_banner(self):
         """Print application banner"""
         print(f"{Colors.MAGENTA}{Colors.BOLD}")
@@ -277,14 +671,16 @@ class RegionalSettingsReset:
         
     def validate_locale(self, locale: str) -> bool:
         """Validate if locale is supported"""
-        return locale in self.config.SUPPORTED_LOCALES
+        return locale in RegionalSettingsConfig.SUPPORTED_LOCALE_CODES
         
     def list_supported_locales(self):
         """Display supported locales"""
-        print(f"\n{Colors.CYAN}Supported Locales:{Colors.RESET}")
-        for code, name in self.config.SUPPORTED_LOCALES.items():
-            print(f"  {Colors.WHITE}{code:<8}{Colors.RESET} - {name}")
-        print()
+        white, reset = Colors.WHITE, Colors.RESET
+        lines = [f"\n{Colors.CYAN}Supported Locales:{reset}"]
+        for code, name in self.config.LOCALES_ITEMS:
+            lines.append(f"  {white}{code:<8}{reset} - {name}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
         
     def create_backup(self, registry_path: str, backup_name: str) -> bool:
         """Create registry backup"""
@@ -302,15 +698,26 @@ class RegionalSettingsReset:
                 
             backup_file = os.path.join(self.backup_path, f"{backup_name}.reg")
             
-            # Use reg.exe to export registry
+            # Export in-process to avoid starting reg.exe for every backup
+            try:
+                _export_registry_key(registry_path, backup_file)
+                self.log_success(f"Backed up {registry_path} to {backup_file}")
+                return True
+            except Exception as e:
+                self.log_warning(f"In-process export failed for {registry_path}, using reg.exe: {e}")
+            
+            # Fall back to reg.exe to export registry
+            import subprocess
             cmd = ["reg", "export", registry_path, backup_file, "/y"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
             
             if result.returncode == 0:
                 self.log_success(f"Backed up {registry_path} to {backup_file}")
                 return True
             else:
-                self.log_error(f"Failed to backup {registry_path}: {result.stderr}")
+                # Output is only decoded when it is actually reported
+                stderr = result.stderr.decode('mbcs', errors='replace')
+                self.log_error(f"Failed to backup {registry_path}: {stderr}")
                 return False
                 
         except Exception as e:
@@ -334,16 +741,19 @@ class RegionalSettingsReset:
             try:
                 self.operation_count += 1
                 
-                # Open/create registry key
-                with winreg.CreateKey(hive, key_path) as key:
-                    winreg.SetValueEx(key, value_name, 0, value_type, value_data)
+                # Open/create key and set the value in one call
+                _set_registry_value_direct(hive, key_path, value_name, value_type, value_data)
                     
-                # Verify the value was set
-                with winreg.OpenKey(hive, key_path) as key:
-                    stored_value, _ = winreg.QueryValueEx(key, value_name)
-                    if stored_value == value_data:
-                        self.log_success(f"Set {key_path}\\{value_name} = {value_data}")
-                        return True
+                # Read the value back only when verification is requested
+                if self.user_config.get('verifyWrites', False):
+                    with winreg.OpenKeyEx(hive, key_path, 0, winreg.KEY_QUERY_VALUE) as key:
+                        stored_value, _ = winreg.QueryValueEx(key, value_name)
+                    if stored_value != value_data:
+                        # Handled like any other failed attempt: logged, then retried
+                        raise ValueError(f"verification failed, read back {stored_value!r}")
+                        
+                self.log_success(f"Set {key_path}\\{value_name} = {value_data}")
+                return True
                         
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -366,7 +776,11 @@ class RegionalSettingsReset:
             hkcu = winreg.HKEY_CURRENT_USER
             intl_path = "Control Panel\\International"
             
-            # Apply core settings
+            # Apply all settings in one registry import when possible
+            if self._apply_locale_settings_batch(f"HKEY_CURRENT_USER\\{intl_path}", locale_settings):
+                return True
+                
+            # Fall back to per-value writes
             for setting_name, setting_value in locale_settings.items():
                 if isinstance(setting_value, int):
                     value_type = winreg.REG_DWORD
@@ -378,72 +792,77 @@ class RegionalSettingsReset:
         else:
             # Demo mode for non-Windows platforms
             self.log_info(f"[DEMO MODE] Applying {len(locale_settings)} settings for {locale}")
+            # Skip building per-setting messages when INFO logging is disabled
+            log_each = self.logger.isEnabledFor(logging.INFO)
             for setting_name, setting_value in locale_settings.items():
-                self.log_info(f"[DEMO] {setting_name} = {setting_value}")
+                if log_each:
+                    self.log_info(f"[DEMO] {setting_name} = {setting_value}")
                 self.operation_count += 1
                 self.success_count += 1
                 
         return success
         
-    def _get_locale_settings(self, locale: str) -> Dict[str, Any]:
+    def _apply_locale_settings_batch(self, key_path: str, locale_settings: Mapping[str, Any]) -> bool:
+        """Apply locale settings with a single reg import instead of per-value writes"""
+        lines = [f"[{key_path}]"]
+        for setting_name, setting_value in locale_settings.items():
+            value_type = winreg.REG_DWORD if isinstance(setting_value, int) else winreg.REG_SZ
+            lines.append(_format_reg_value(setting_name, setting_value, value_type))
+        lines.append("")
+        
+        max_retries = max(1, self.user_config.get('maxRetries', 3))
+        verify = self.user_config.get('verifyWrites', False)
+        
+        try:
+            import subprocess
+            fd, reg_file = tempfile.mkstemp(prefix="RegionalSettings_", suffix=".reg")
+            try:
+                _write_reg_file(fd, lines)
+                
+                for attempt in range(max_retries):
+                    result = subprocess.run(
+                        ["reg", "import", reg_file], capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW
+                    )
+                    if result.returncode != 0:
+                        error = result.stderr.decode('mbcs', errors='replace').strip()
+                    else:
+                        # Read the values back only when verification is requested
+                        mismatched = self._verify_registry_values(key_path, locale_settings) if verify else []
+                        if not mismatched:
+                            self.operation_count += len(locale_settings)
+                            self.success_count += len(locale_settings)
+                            self.log_info(f"Imported {len(locale_settings)} settings into {key_path}", Colors.GREEN)
+                            return True
+                        error = f"verification failed for {', '.join(mismatched)}"
+                        
+                    if attempt < max_retries - 1:
+                        self.log_warning(f"Batch registry import attempt {attempt + 1} failed for {key_path}: {error}")
+            finally:
+                os.remove(reg_file)
+        except Exception as e:
+            self.log_warning(f"Batch registry import failed for {key_path}: {e}")
+            return False
+            
+        self.log_warning(f"Batch registry import failed for {key_path} after {max_retries} attempts: {error}")
+        return False
+        
+    def _verify_registry_values(self, key_path: str, expected: Mapping[str, Any]) -> List[str]:
+        """Return the names of values under key_path that differ from the expected data"""
+        _, hive, subkey = _split_registry_path(key_path)
+        names = tuple(expected)
+        with winreg.OpenKeyEx(hive, subkey, 0, winreg.KEY_QUERY_VALUE) as key:
+            stored = _read_values(key, names)
+        return [name for name in names if stored[name] != expected[name]]
+        
+    def _get_locale_settings(self, locale: str) -> Mapping[str, Any]:
         """Get locale-specific registry settings (cached for performance)"""
         # Check cache first
-        if locale in self.config.LOCALE_SETTINGS_CACHE:
-            return self.config.LOCALE_SETTINGS_CACHE[locale]
-        
-        locale_configs = {
-            "pl-PL": {
-                "Locale": locale,
-                "LocaleName": locale,
-                "sLanguage": "PLK",
-                "sCountry": "Poland",
-                "sShortDate": "dd.MM.yyyy",
-                "sLongDate": "d MMMM yyyy",
-                "sTimeFormat": "HH:mm:ss",
-                "sShortTime": "HH:mm",
-                "sCurrency": "zł",
-                "sMonDecimalSep": ",",
-                "sMonThousandSep": " ",
-                "sDecimal": ",",
-                "sThousand": " ",
-                "sList": ";",
-                "iCountry": 48,
-                "iCurrency": 3,
-                "iCurrDigits": 2,
-                "iDate": 1,
-                "iTime": 1,
-                "iTLZero": 1,
-                "s1159": "",
-                "s2359": ""
-            },
-            "en-US": {
-                "Locale": locale,
-                "LocaleName": locale,
-                "sLanguage": "ENU",
-                "sCountry": "United States",
-                "sShortDate": "M/d/yyyy",
-                "sLongDate": "dddd, MMMM d, yyyy",
-                "sTimeFormat": "h:mm:ss tt",
-                "sShortTime": "h:mm tt",
-                "sCurrency": "$",
-                "sMonDecimalSep": ".",
-                "sMonThousandSep": ",",
-                "sDecimal": ".",
-                "sThousand": ",",
-                "sList": ",",
-                "iCountry": 1,
-                "iCurrency": 0,
-                "iCurrDigits": 2,
-                "iDate": 0,
-                "iTime": 0,
-                "iTLZero": 0,
-                "s1159": "AM",
-                "s2359": "PM"
-            }
-            # Add more locales as needed
-        }
-        
-        result = locale_configs.get(locale, {
+        cache = self.config.LOCALE_SETTINGS_CACHE
+        result = cache.get(locale)
+        if result is not None:
+            return result
+        
+        result = _LOCALE_CONFIGS.get(locale) or MappingProxyType({
             "Locale": locale,
             "LocaleName": locale,
             "sLanguage": locale.split('-')[0].upper(),
@@ -451,7 +870,7 @@ class RegionalSettingsReset:
         })
         
         # Cache for future use
-        self.config.LOCALE_SETTINGS_CACHE[locale] = result
+        cache[locale] = result
         return result
         
     def reset_windows11_memory_slots(self) -> bool:
@@ -465,15 +884,16 @@ class RegionalSettingsReset:
         try:
             hkcu = winreg.HKEY_CURRENT_USER
             
-            # Clear user profile settings
-            profile_path = "Control Panel\\International\\User Profile"
+            # The user profile key holds the language and input method list, so it
+            # is only checked here and never deleted
             try:
-                winreg.DeleteTree(hkcu, profile_path)
-                self.log_success("Cleared user profile regional settings")
+                with winreg.OpenKeyEx(hkcu, "Control Panel\\International\\User Profile", 0, winreg.KEY_QUERY_VALUE):
+                    pass
+                self.log_info("User profile regional settings preserved (language list is not modified)")
             except FileNotFoundError:
-                self.log_info("User profile settings already cleared")
+                self.log_info("No user profile regional settings present")
             except Exception as e:
-                self.log_warning(f"Could not clear user profile: {e}")
+                self.log_warning(f"Could not check user profile regional settings: {e}")
                 
             return True
             
@@ -513,31 +933,86 @@ class RegionalSettingsReset:
         """Generate execution statistics report"""
         success_rate = (self.success_count / max(self.operation_count, 1)) * 100
         
-        report = f"""
-{Colors.CYAN}Execution Statistics:{Colors.RESET}
-  Total Operations: {self.operation_count}
-  Successful: {Colors.GREEN}{self.success_count}{Colors.RESET}
-  Failed: {Colors.RED}{self.error_count}{Colors.RESET}
-  Success Rate: {Colors.BLUE}{success_rate:.1f}%{Colors.RESET}
-  
-{Colors.CYAN}Files:{Colors.RESET}
-  Log File: {Colors.WHITE}{self.log_file}{Colors.RESET}
-  Backup Directory: {Colors.WHITE}{self.backup_path or 'None created'}{Colors.RESET}
-"""
-        return report
+        return _STATS_TEMPLATE.format(
+            operations=self.operation_count,
+            successes=self.success_count,
+            errors=self.error_count,
+            success_rate=success_rate,
+            log_file=self.log_file,
+            backup_path=self.backup_path or 'None created'
+        )
 
 class InteractiveMenu:
     """Interactive menu system for the application"""
     
+    # Static parts of the main menu, rendered once at class creation
+    _MENU_HEADER = (
+        f"{Colors.MAGENTA}{Colors.BOLD}\n"
+        + "╔" + "═" * 58 + "╗\n"
+        + "║     Windows Regional Settings Reset - Python Edition    ║\n"
+        + "║                        v2.0                             ║\n"
+        + "╚" + "═" * 58 + "╝\n"
+        + f"{Colors.RESET}\n"
+    )
+    
+    _MENU_ITEMS_TEXT = "".join(
+        f"{Colors.CYAN}{num}.{Colors.RESET} {Colors.WHITE}{title:<20}{Colors.RESET} {Colors.GRAY}- {desc}{Colors.RESET}\n"
+        for num, title, desc in (
+            ("1", "Quick Reset", "Reset regional settings with current locale"),
+            ("2", "Configure Settings", "Choose locale and advanced options"),
+            ("3", "Backup Management", "Create, restore, and manage backups"),
+            ("4", "Validation Tools", "System validation and testing"),
+            ("5", "System Information", "View current regional settings"),
+            ("6", "Configuration", "Manage configuration files"),
+            ("7", "Help & Examples", "Usage examples and documentation"),
+            ("8", "About", "Version and license information"),
+            ("9", "Exit", "Quit the application")
+        )
+    )
+    
+    # Registry values shown by system_information: (value name, display name)
+    INTL_SETTINGS = (
+        ("Locale", "System Locale"),
+        ("LocaleName", "Locale Name"),
+        ("sCountry", "Country"),
+        ("sShortDate", "Short Date Format"),
+        ("sTimeFormat", "Time Format"),
+        ("sCurrency", "Currency Symbol")
+    )
+    
+    # Seconds a registry read stays valid for the settings view
+    REG_CACHE_TTL = 5.0
+    
     def __init__(self):
-        self.app = None
+        # Shared application instance reused across menu actions
+        self.app = RegionalSettingsReset()
         self.current_locale = "pl-PL"
+        # Admin state cannot change during the process lifetime
+        self.is_admin = self.app.is_admin
+        # Clearing the screen relies on ANSI sequences instead of spawning cls
+        _enable_virtual_terminal()
+        # Cached International registry values, invalidated after writes
+        self._reg_cache = None
+        self._reg_cache_ts = 0.0
+        # International key handle kept open for the whole menu session
+        self._intl_key = None
+        if WINDOWS_AVAILABLE:
+            try:
+                self._get_intl_key()
+            except OSError:
+                pass
+        
+    def _get_intl_key(self):
+        """Return the session's International key handle, opening it on first use"""
+        if self._intl_key is None:
+            self._intl_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Control Panel\\International")
+        return self._intl_key
         
     def run(self):
         """Run the interactive menu"""
         while True:
             self.show_main_menu()
-            choice = input(f"\n{Colors.CYAN}Enter your choice (1-9): {Colors.RESET}").strip()
+            choice = _read_key(f"\n{Colors.CYAN}Press 1-9: {Colors.RESET}").strip()
             
             if choice == '1':
                 self.quick_reset()
@@ -565,50 +1040,21 @@ class InteractiveMenu:
             
     def show_main_menu(self):
         """Display the main menu"""
-        os.system('cls' if os.name == 'nt' else 'clear')
-        
-        print(f"{Colors.MAGENTA}{Colors.BOLD}")
-        print("╔" + "═" * 58 + "╗")
-        print("║     Windows Regional Settings Reset - Python Edition    ║")
-        print("║                        v2.0                             ║")
-        print("╚" + "═" * 58 + "╝")
-        print(f"{Colors.RESET}")
-        
-        print(f"{Colors.WHITE}Current Locale: {Colors.GREEN}{self.current_locale}{Colors.RESET}")
-        print(f"{Colors.WHITE}Admin Rights: {Colors.GREEN if self._check_admin() else Colors.RED}{'Yes' if self._check_admin() else 'No'}{Colors.RESET}")
-        print()
-        
-        menu_items = [
-            ("1", "Quick Reset", "Reset regional settings with current locale"),
-            ("2", "Configure Settings", "Choose locale and advanced options"),
-            ("3", "Backup Management", "Create, restore, and manage backups"),
-            ("4", "Validation Tools", "System validation and testing"),
-            ("5", "System Information", "View current regional settings"),
-            ("6", "Configuration", "Manage configuration files"),
-            ("7", "Help & Examples", "Usage examples and documentation"),
-            ("8", "About", "Version and license information"),
-            ("9", "Exit", "Quit the application")
-        ]
-        
-        for num, title, desc in menu_items:
-            print(f"{Colors.CYAN}{num}.{Colors.RESET} {Colors.WHITE}{title:<20}{Colors.RESET} {Colors.GRAY}- {desc}{Colors.RESET}")
-            
-    def _check_admin(self) -> bool:
-        """Check admin privileges"""
-        if not WINDOWS_AVAILABLE:
-            return False
-            
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin() != 0
-        except:
-            return False
+        is_admin = self.is_admin
+        sys.stdout.write(
+            Colors.CLEAR_SCREEN
+            + self._MENU_HEADER
+            + f"{Colors.WHITE}Current Locale: {Colors.GREEN}{self.current_locale}{Colors.RESET}\n"
+            + f"{Colors.WHITE}Admin Rights: {Colors.GREEN if is_admin else Colors.RED}{'Yes' if is_admin else 'No'}{Colors.RESET}\n\n"
+            + self._MENU_ITEMS_TEXT
+        )
             
     def quick_reset(self):
         """Quick reset with current settings"""
         print(f"\n{Colors.YELLOW}Quick Reset - {self.current_locale}{Colors.RESET}")
         print("=" * 40)
         
-        if not self._check_admin():
+        if not self.is_admin:
             print(f"{Colors.RED}Administrator privileges required!{Colors.RESET}")
             return
             
@@ -617,8 +1063,8 @@ class InteractiveMenu:
             print("Operation cancelled.")
             return
             
-        # Initialize application
-        self.app = RegionalSettingsReset()
+        # Start a fresh set of statistics for this action
+        self.app.reset_statistics()
         self.app.print_banner()
         
         # Perform reset
@@ -630,7 +1076,9 @@ class InteractiveMenu:
             )
             
             # Apply settings
-            if self.app.apply_locale_settings(self.current_locale):
+            applied = self.app.apply_locale_settings(self.current_locale)
+            self._reg_cache = None
+            if applied:
                 print(f"\n{Colors.GREEN}Quick reset completed successfully!{Colors.RESET}")
             else:
                 print(f"\n{Colors.YELLOW}Reset completed with some warnings.{Colors.RESET}")
@@ -643,18 +1091,20 @@ class InteractiveMenu:
             
     def configure_settings(self):
         """Configure locale and advanced settings"""
-        print(f"\n{Colors.YELLOW}Configure Settings{Colors.RESET}")
-        print("=" * 30)
+        lines = [f"\n{Colors.YELLOW}Configure Settings{Colors.RESET}", "=" * 30]
         
         # Show supported locales
-        print(f"\n{Colors.CYAN}Supported Locales:{Colors.RESET}")
-        locales = list(RegionalSettingsConfig.SUPPORTED_LOCALES.items())
+        lines.append(f"\n{Colors.CYAN}Supported Locales:{Colors.RESET}")
+        locales = RegionalSettingsConfig.LOCALES_ITEMS
         
+        white, reset = Colors.WHITE, Colors.RESET
+        current_marker = f"{Colors.GREEN}→{reset}"
         for i, (code, name) in enumerate(locales, 1):
-            marker = f"{Colors.GREEN}→{Colors.RESET}" if code == self.current_locale else " "
-            print(f"{marker} {i:2}. {Colors.WHITE}{code:<8}{Colors.RESET} - {name}")
+            marker = current_marker if code == self.current_locale else " "
+            lines.append(f"{marker} {i:2}. {white}{code:<8}{reset} - {name}")
             
-        print(f"\n{Colors.WHITE}Current: {Colors.GREEN}{self.current_locale}{Colors.RESET}")
+        lines.append(f"\n{Colors.WHITE}Current: {Colors.GREEN}{self.current_locale}{Colors.RESET}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         try:
             choice = input(f"\nSelect locale number (1-{len(locales)}) or Enter to keep current: ").strip()
@@ -682,8 +1132,9 @@ class InteractiveMenu:
             ("6", "Back to Main Menu", "Return to main menu")
         ]
         
+        cyan, white, gray, reset = Colors.CYAN, Colors.WHITE, Colors.GRAY, Colors.RESET
         for num, title, desc in backup_options:
-            print(f"{Colors.CYAN}{num}.{Colors.RESET} {Colors.WHITE}{title:<20}{Colors.RESET} {Colors.GRAY}- {desc}{Colors.RESET}")
+            print(f"{cyan}{num}.{reset} {white}{title:<20}{reset} {gray}- {desc}{reset}")
             
         choice = input(f"\n{Colors.CYAN}Select option (1-6): {Colors.RESET}").strip()
         
@@ -701,49 +1152,54 @@ class InteractiveMenu:
     def _list_backups(self):
         """List available backups"""
         temp_dir = tempfile.gettempdir()
-        backup_pattern = "RegionalSettings_Backup_*"
         
-        backups = []
-        for item in Path(temp_dir).glob(backup_pattern):
-            if item.is_dir():
-                backups.append(item)
+        # scandir returns entry types with the listing, avoiding a stat per match
+        with os.scandir(temp_dir) as entries:
+            backups = [
+                entry for entry in entries
+                if entry.name.startswith("RegionalSettings_Backup_") and entry.is_dir(follow_symlinks=False)
+            ]
                 
         if not backups:
             print(f"\n{Colors.YELLOW}No backups found.{Colors.RESET}")
             return
             
-        print(f"\n{Colors.CYAN}Available Backups:{Colors.RESET}")
-        for i, backup in enumerate(sorted(backups), 1):
+        white, reset = Colors.WHITE, Colors.RESET
+        lines = [f"\n{Colors.CYAN}Available Backups:{reset}"]
+        for i, backup in enumerate(sorted(backups, key=lambda entry: entry.name), 1):
             # Extract date/time from folder name
-            match = re.search(r'(\d{8})_(\d{6})', backup.name)
+            formatted_date, formatted_time = "Unknown", ""
+            match = _BACKUP_TS_RE.search(backup.name)
             if match:
                 date_str, time_str = match.groups()
                 formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
                 formatted_time = f"{time_str[:2]}:{time_str[2:4]}:{time_str[4:6]}"
                 
-            file_count = len(list(backup.glob("*.reg")))
-            print(f"{Colors.WHITE}{i:2}.{Colors.RESET} {backup.name}")
-            print(f"     Date: {formatted_date} {formatted_time}")
-            print(f"     Files: {file_count} registry files")
-            print()
+            with os.scandir(backup.path) as files:
+                file_count = sum(1 for f in files if f.name.endswith(".reg"))
+            lines.append(f"{white}{i:2}.{reset} {backup.name}")
+            lines.append(f"     Date: {formatted_date} {formatted_time}")
+            lines.append(f"     Files: {file_count} registry files")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
             
     def _create_backup(self):
         """Create new backup"""
-        if not self._check_admin():
+        if not self.is_admin:
             print(f"{Colors.RED}Administrator privileges required for backup creation!{Colors.RESET}")
             return
             
         print(f"\n{Colors.YELLOW}Creating backup...{Colors.RESET}")
         
-        app = RegionalSettingsReset()
-        success = app.create_backup(
+        self.app.reset_statistics()
+        success = self.app.create_backup(
             "HKEY_CURRENT_USER\\Control Panel\\International",
             "Manual_Backup"
         )
         
         if success:
             print(f"{Colors.GREEN}Backup created successfully!{Colors.RESET}")
-            print(f"Location: {app.backup_path}")
+            print(f"Location: {self.app.backup_path}")
         else:
             print(f"{Colors.RED}Backup creation failed.{Colors.RESET}")
             
@@ -768,22 +1224,27 @@ class InteractiveMenu:
         print(f"{Colors.CYAN}System Checks:{Colors.RESET}")
         
         # Check Windows version
-        import platform
-        print(f"Windows Version: {Colors.WHITE}{platform.version()}{Colors.RESET}")
+        if WINDOWS_AVAILABLE:
+            winver = sys.getwindowsversion()
+            windows_version = f"{winver.major}.{winver.minor}.{winver.build}"
+        else:
+            windows_version = f"Not Available ({_PLATFORM})"
+        print(f"Windows Version: {Colors.WHITE}{windows_version}{Colors.RESET}")
         
         # Check Python version
-        print(f"Python Version: {Colors.WHITE}{sys.version.split()[0]}{Colors.RESET}")
+        print(f"Python Version: {Colors.WHITE}{_PYVER}{Colors.RESET}")
         
         # Check admin privileges
-        admin_status = self._check_admin()
+        admin_status = self.is_admin
         color = Colors.GREEN if admin_status else Colors.RED
         print(f"Admin Privileges: {color}{'Yes' if admin_status else 'No'}{Colors.RESET}")
         
         # Check registry access
         if WINDOWS_AVAILABLE:
             try:
-                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Control Panel\\International"):
-                    registry_access = True
+                # Query the open handle so access is tested now, not only at startup
+                winreg.QueryInfoKey(self._get_intl_key())
+                registry_access = True
             except:
                 registry_access = False
         else:
@@ -795,123 +1256,101 @@ class InteractiveMenu:
         
     def system_information(self):
         """Display current system regional information"""
-        print(f"\n{Colors.YELLOW}Current Regional Settings{Colors.RESET}")
-        print("=" * 35)
-        
-        if not WINDOWS_AVAILABLE:
-            print(f"{Colors.YELLOW}[DEMO MODE] Registry access not available on this platform{Colors.RESET}")
-            print(f"{Colors.CYAN}Platform:{Colors.RESET} {Colors.WHITE}{sys.platform}{Colors.RESET}")
-            print(f"{Colors.CYAN}Python Version:{Colors.RESET} {Colors.WHITE}{sys.version.split()[0]}{Colors.RESET}")
-            print(f"{Colors.CYAN}Demo Locale:{Colors.RESET} {Colors.WHITE}{self.current_locale}{Colors.RESET}")
-            return
-        
-        try:
-            # Read current locale settings
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Control Panel\\International") as key:
-                settings = [
-                    ("Locale", "System Locale"),
-                    ("LocaleName", "Locale Name"),
-                    ("sCountry", "Country"),
-                    ("sShortDate", "Short Date Format"),
-                    ("sTimeFormat", "Time Format"),
-                    ("sCurrency", "Currency Symbol")
-                ]
+        with _buffered_output():
+            print(f"\n{Colors.YELLOW}Current Regional Settings{Colors.RESET}")
+            print("=" * 35)
+            
+            if not WINDOWS_AVAILABLE:
+                print(f"{Colors.YELLOW}[DEMO MODE] Registry access not available on this platform{Colors.RESET}")
+                print(_LABEL_FMT % ("Platform", _PLATFORM))
+                print(_LABEL_FMT % ("Python Version", _PYVER))
+                print(_LABEL_FMT % ("Demo Locale", self.current_locale))
+                return
+            
+            try:
+                # Read current locale settings
+                values = self._read_intl_settings()
                 
-                for reg_name, display_name in settings:
-                    try:
-                        value, _ = winreg.QueryValueEx(key, reg_name)
-                        print(f"{Colors.CYAN}{display_name}:{Colors.RESET} {Colors.WHITE}{value}{Colors.RESET}")
-                    except FileNotFoundError:
-                        print(f"{Colors.CYAN}{display_name}:{Colors.RESET} {Colors.GRAY}Not set{Colors.RESET}")
+                for reg_name, display_name in self.INTL_SETTINGS:
+                    value = values[reg_name]
+                    if value is not None:
+                        print(_LABEL_FMT % (display_name, value))
+                    else:
+                        print(_LABEL_NOT_SET_FMT % display_name)
                         
-        except Exception as e:
-            print(f"{Colors.RED}Error reading registry: {e}{Colors.RESET}")
+            except Exception as e:
+                print(f"{Colors.RED}Error reading registry: {e}{Colors.RESET}")
+            
+    def _read_intl_settings(self) -> Dict[str, Any]:
+        """Read the displayed International values (cached briefly between menu visits)"""
+        now = time.monotonic()
+        if self._reg_cache is not None and now - self._reg_cache_ts < self.REG_CACHE_TTL:
+            return self._reg_cache
             
+        # Writes made through other handles are visible through this one
+        values = _read_values(self._get_intl_key(), tuple(name for name, _ in self.INTL_SETTINGS))
+        
+        self._reg_cache = values
+        self._reg_cache_ts = now
+        return values
+        
     def configuration_management(self):
         """Configuration file management"""
-        print(f"\n{Colors.YELLOW}Configuration Management{Colors.RESET}")
-        print("=" * 35)
-        
         config_file = "config.json"
+        config_exists = os.path.exists(config_file)
         
-        if os.path.exists(config_file):
-            print(f"{Colors.GREEN}Configuration file found: {config_file}{Colors.RESET}")
+        with _buffered_output():
+            print(f"\n{Colors.YELLOW}Configuration Management{Colors.RESET}")
+            print("=" * 35)
             
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+            if config_exists:
+                print(f"{Colors.GREEN}Configuration file found: {config_file}{Colors.RESET}")
+                
+                try:
+                    # Validate through the cached parser, then show the file as written
+                    # instead of re-serializing the parsed configuration
+                    _load_config_file(config_file, os.path.getmtime(config_file))
+                        
+                    print(f"\n{Colors.CYAN}Current Configuration:{Colors.RESET}")
+                    print(Path(config_file).read_text(encoding='utf-8').rstrip())
                     
-                print(f"\n{Colors.CYAN}Current Configuration:{Colors.RESET}")
-                print(json.dumps(config, indent=2))
+                except Exception as e:
+                    print(f"{Colors.RED}Error reading configuration: {e}{Colors.RESET}")
+            else:
+                print(f"{Colors.YELLOW}No configuration file found.{Colors.RESET}")
                 
-            except Exception as e:
-                print(f"{Colors.RED}Error reading configuration: {e}{Colors.RESET}")
-        else:
-            print(f"{Colors.YELLOW}No configuration file found.{Colors.RESET}")
-            
+        if not config_exists:
             create = input(f"Create default configuration file? (y/N): ")
             if create.lower() == 'y':
                 try:
-                    with open(config_file, 'w') as f:
-                        json.dump(RegionalSettingsConfig.DEFAULT_CONFIG, f, indent=2)
+                    Path(config_file).write_bytes(_DEFAULT_CONFIG_JSON)
                     print(f"{Colors.GREEN}Configuration file created: {config_file}{Colors.RESET}")
                 except Exception as e:
                     print(f"{Colors.RED}Error creating configuration: {e}{Colors.RESET}")
                     
     def help_and_examples(self):
         """Help and usage examples"""
-        print(f"\n{Colors.YELLOW}Help & Examples{Colors.RESET}")
-        print("=" * 25)
-        
-        examples = [
-            ("Quick Reset", "Use option 1 for immediate reset with current locale"),
-            ("Change Locale", "Use option 2 to select different locale"),
-            ("Backup First", "Always create backup before making changes"),
-            ("Check Status", "Use option 5 to view current settings"),
-            ("Admin Required", "Most operations require administrator privileges"),
-            ("Configuration", "Use config.json for advanced settings")
-        ]
-        
-        for title, desc in examples:
-            print(f"{Colors.CYAN}• {title}:{Colors.RESET} {desc}")
-            
-        print(f"\n{Colors.CYAN}Command Line Usage:{Colors.RESET}")
-        print("python regional_settings_reset.py --locale en-US --force")
-        print("python regional_settings_reset.py --config config.json")
-        print("python regional_settings_reset.py --help")
+        sys.stdout.write(_HELP_TEXT)
+        sys.stdout.flush()
         
     def about(self):
         """About information"""
-        print(f"\n{Colors.YELLOW}About{Colors.RESET}")
-        print("=" * 15)
-        
-        print(f"{Colors.CYAN}Windows Regional Settings Reset - Python Edition{Colors.RESET}")
-        print(f"Version: {Colors.WHITE}2.0{Colors.RESET}")
-        print(f"License: {Colors.WHITE}MIT{Colors.RESET}")
-        print(f"Platform: {Colors.WHITE}Windows 10/11{Colors.RESET}")
-        print(f"Python: {Colors.WHITE}{sys.version.split()[0]}+{Colors.RESET}")
-        
-        print(f"\n{Colors.CYAN}Features:{Colors.RESET}")
-        features = [
-            "Interactive menu system",
-            "Comprehensive regional settings reset",
-            "Backup and restore functionality",
-            "Multiple locale support",
-            "Configuration management",
-            "System validation tools"
-        ]
-        
-        for feature in features:
-            print(f"• {feature}")
+        sys.stdout.write(_ABOUT_TEXT)
+        sys.stdout.flush()
             
     def exit_application(self):
         """Exit the application"""
+        if self._intl_key is not None:
+            winreg.CloseKey(self._intl_key)
+            self._intl_key = None
+            
         print(f"\n{Colors.CYAN}Thank you for using Windows Regional Settings Reset!{Colors.RESET}")
         print(f"{Colors.GRAY}Goodbye!{Colors.RESET}")
 
-def main():
-    """Main function with command line argument support"""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser(
+        prog="regional_settings_reset.py",
         description="Windows Regional Settings Reset - Python Edition v2.0",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -928,7 +1367,11 @@ Examples:
     parser.add_argument('--config', help='Configuration file path')
     parser.add_argument('--log', help='Log file path')
     parser.add_argument('--menu', action='store_true', help='Force interactive menu')
-    
+    return parser
+
+def main():
+    """Main function with command line argument support"""
+    parser = build_parser()
     args = parser.parse_args()
     
     # If no arguments or --menu specified, run interactive mode
@@ -938,7 +1381,11 @@ Examples:
     else:
         # Command line mode
         app = RegionalSettingsReset(config_file=args.config, log_file=args.log)
-        app.print_banner()
+        
+        # Unattended runs (--force with redirected output) skip the decorative output
+        unattended = args.force and not sys.stdout.isatty()
+        if not unattended:
+            app.print_banner()
         
         if args.locale:
             if not app.validate_locale(args.locale):
@@ -954,7 +1401,8 @@ Examples:
                     
             # Perform reset
             success = app.apply_locale_settings(args.locale)
-            print(app.generate_statistics_report())
+            if not unattended:
+                print(app.generate_statistics_report())
             
             sys.exit(0 if success else 1)
         else:
@@ -6,14 +6,45 @@ Comprehensive test suite covering all three implementations
 
 import sys
 import os
-import subprocess
+import io
 import json
+import re
+import threading
 import time
-import tempfile
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
+# Quoted locale codes such as "pl-PL" in any implementation's source
+_LOCALE_RE = re.compile(rb'"([a-z]{2}-[A-Z]{2})"')
+
+# Marks the end of each command's output in the shared PowerShell session
+_PS_SENTINEL = "<<<END>>>"
+
+# Optional faster JSON serializer with stdlib fallback
+try:
+    import orjson
+    
+    def _dump_report(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_report(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+# Same as regional_settings_reset._buffered_output; duplicated because the runner
+# must not import the application module just to print its report
+@contextmanager
+def _buffered_print():
+    """Collect everything printed inside the block and write it to stdout at once"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
 class TestResult:
     def __init__(self, name: str, passed: bool, message: str = "", execution_time: float = 0.0):
         self.name = name
@@ -28,29 +59,81 @@ class TestFramework:
         self.passed_tests = 0
         self.failed_tests = 0
         
+        # Shared PowerShell session, started on first use by _ps_eval
+        self._ps = None
+        self._ps_lock = threading.Lock()
+        
+    def _ps_eval(self, command: str, timeout: float = 10) -> str:
+        """Run a command in the shared PowerShell session and return its output"""
+        import subprocess
+        
+        with self._ps_lock:
+            if self._ps is None or self._ps.poll() is not None:
+                self._ps = subprocess.Popen(
+                    ["powershell", "-NoProfile", "-NonInteractive", "-Command", "-"],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                    text=True, bufsize=1
+                )
+            
+            ps = self._ps
+            # A hung command kills the session, which ends the read loop below
+            watchdog = threading.Timer(timeout, ps.kill)
+            watchdog.start()
+            try:
+                ps.stdin.write(f"{command}; Write-Output '{_PS_SENTINEL}'\n")
+                ps.stdin.flush()
+                
+                lines = []
+                for line in ps.stdout:
+                    if line.rstrip() == _PS_SENTINEL:
+                        return "".join(lines)
+                    lines.append(line)
+            finally:
+                watchdog.cancel()
+            
+            self._ps = None
+            raise RuntimeError("PowerShell session ended unexpectedly")
+    
+    def close(self):
+        """Shut down the shared PowerShell session if one was started"""
+        if self._ps is None:
+            return
+        
+        try:
+            self._ps.stdin.write("exit\n")
+            self._ps.stdin.close()
+            self._ps.wait(timeout=5)
+        except Exception:
+            self._ps.kill()
+        self._ps = None
+        
     def run_test(self, test_name: str, test_func, *args, **kwargs) -> TestResult:
         """Run a single test and record results"""
-        print(f"Running: {test_name}... ", end="", flush=True)
-        start_time = time.time()
+        return self._record_result(*self._execute_test(test_name, test_func, *args, **kwargs))
+    
+    def _execute_test(self, test_name: str, test_func, *args, **kwargs) -> Tuple[TestResult, str]:
+        """Run a single test without touching shared state (safe to call from worker threads)"""
+        start_time = time.perf_counter_ns()
         
         try:
             result = test_func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_time) / 1e9
             
             if result is True:
-                print("✅ PASS")
-                test_result = TestResult(test_name, True, "Test passed", execution_time)
-                self.passed_tests += 1
-            else:
-                print("❌ FAIL")
-                message = result if isinstance(result, str) else "Test failed"
-                test_result = TestResult(test_name, False, message, execution_time)
-                self.failed_tests += 1
+                return TestResult(test_name, True, "Test passed", execution_time), "✅ PASS"
+            message = result if isinstance(result, str) else "Test failed"
+            return TestResult(test_name, False, message, execution_time), "❌ FAIL"
                 
         except Exception as e:
-            execution_time = time.time() - start_time
-            print(f"❌ ERROR: {str(e)}")
-            test_result = TestResult(test_name, False, f"Exception: {str(e)}", execution_time)
+            execution_time = (time.perf_counter_ns() - start_time) / 1e9
+            return TestResult(test_name, False, f"Exception: {str(e)}", execution_time), f"❌ ERROR: {str(e)}"
+    
+    def _record_result(self, test_result: TestResult, status: str) -> TestResult:
+        """Print the outcome of a finished test and add it to the totals"""
+        sys.stdout.write(f"Running: {test_result.name}... {status}\n")
+        if test_result.passed:
+            self.passed_tests += 1
+        else:
             self.failed_tests += 1
             
         self.results.append(test_result)
@@ -60,41 +143,37 @@ class TestFramework:
     def test_powershell_syntax(self) -> bool:
         """Test PowerShell script syntax"""
         try:
-            result = subprocess.run([
-                'powershell', '-Command',
-                "Get-Content '../scripts/Reset-RegionalSettings.ps1' | Out-Null; Write-Host 'Syntax OK'"
-            ], capture_output=True, text=True, timeout=10)
-            return "Syntax OK" in result.stdout
+            output = self._ps_eval(
+                "Get-Content '../scripts/Reset-RegionalSettings.ps1' | Out-Null; Write-Output 'Syntax OK'"
+            )
+            return "Syntax OK" in output
         except:
             return False
     
     def test_powershell_execution_policy(self) -> bool:
         """Test PowerShell execution policy"""
         try:
-            result = subprocess.run([
-                "powershell", "-Command", "Get-ExecutionPolicy"
-            ], capture_output=True, text=True)
-            
-            policy = result.stdout.strip()
+            policy = self._ps_eval("Get-ExecutionPolicy").strip()
             return policy in ["Unrestricted", "RemoteSigned", "Bypass"]
         except:
             return False
     
-    def test_python_imports(self) -> bool:
-        """Test Python script imports"""
-        try:
-            # Test main script imports
-            result = subprocess.run([
-                sys.executable, "-c", 
-                "import sys; sys.path.append('.'); import regional_settings_reset; print('Imports OK')"
-            ], capture_output=True, text=True, cwd="../python")
-            
-            return "Imports OK" in result.stdout
-        except:
-            return False
+    def test_python_syntax(self) -> bool:
+        """Test Python scripts compile (checked in-process, no interpreter spawn)"""
+        for script in ("../python/regional_settings_reset.py", "../python/launcher.py"):
+            try:
+                compile(Path(script).read_bytes(), script, "exec")
+            except SyntaxError as e:
+                return f"Syntax error in {script}: {e}"
+            except OSError:
+                return f"Missing Python script: {script}"
+        
+        return True
     
     def test_python_demo_mode(self) -> bool:
         """Test Python demo mode execution"""
+        import subprocess
+        
         try:
             # Test with a simple locale application
             result = subprocess.run([
@@ -107,6 +186,8 @@ class TestFramework:
     
     def test_cpp_compilation(self) -> bool:
         """Test C++ compilation"""
+        import subprocess
+        
         try:
             result = subprocess.run([
                 "g++", "-std=c++17", "-pthread", "-c", "regional_settings_reset_v2.cpp"
@@ -118,6 +199,8 @@ class TestFramework:
     
     def test_cpp_demo_execution(self) -> bool:
         """Test C++ demo mode execution"""
+        import subprocess
+        
         try:
             result = subprocess.run([
                 "./regional_settings_reset_v2", "en-US"
@@ -161,55 +244,74 @@ class TestFramework:
     
     def test_locale_consistency(self) -> bool:
         """Test locale consistency across implementations"""
-        # Read locales from different sources
-        locales = {
-            "powershell": [],
-            "python": [],
-            "cpp": []
+        sources = {
+            "powershell": "../scripts/Reset-RegionalSettings.ps1",
+            "python": "../python/regional_settings_reset.py",
+            "cpp": "../cpp/regional_settings_reset_v2.cpp"
         }
         
-        # Check PowerShell locales
-        try:
-            with open("../scripts/Reset-RegionalSettings.ps1", 'r') as f:
-                content = f.read()
-                if '"pl-PL"' in content and '"en-US"' in content:
-                    locales["powershell"] = ["pl-PL", "en-US", "de-DE"]
-        except:
-            pass
+        # Read each source once and collect every quoted locale code in a single scan
+        locales = {}
+        for implementation, path in sources.items():
+            try:
+                locales[implementation] = set(_LOCALE_RE.findall(Path(path).read_bytes()))
+            except OSError:
+                return f"Missing source file: {path}"
         
-        # Check Python locales
-        try:
-            with open("../python/regional_settings_reset.py", 'r') as f:
-                content = f.read()
-                if '"pl-PL"' in content and '"en-US"' in content:
-                    locales["python"] = ["pl-PL", "en-US", "de-DE"]
-        except:
-            pass
+        # Locales known to some implementations but not to all of them
+        drift = set.union(*locales.values()) - set.intersection(*locales.values())
+        if drift:
+            missing = [
+                f"{implementation} lacks {', '.join(sorted(code.decode() for code in drift - found))}"
+                for implementation, found in locales.items()
+                if drift - found
+            ]
+            return f"Locale drift between implementations ({'; '.join(missing)})"
         
-        # Check C++ locales
+        return True
+    
+    def test_reg_value_serializer(self) -> bool:
+        """Test .reg file formatting of each registry value type"""
+        # Imported here so starting the runner does not execute the application module
+        app_dir = str(Path(__file__).resolve().parent.parent / "python")
+        if app_dir not in sys.path:
+            sys.path.insert(0, app_dir)
         try:
-            with open("../cpp/regional_settings_reset_v2.cpp", 'r') as f:
-                content = f.read()
-                if '"pl-PL"' in content and '"en-US"' in content:
-                    locales["cpp"] = ["pl-PL", "en-US", "de-DE"]
-        except:
-            pass
+            import regional_settings_reset as app_module
+        except Exception as e:
+            return f"Could not import regional_settings_reset: {e}"
+        
+        winreg = app_module.winreg
+        cases = [
+            (("sShortDate", 'C:\\Path "x"', winreg.REG_SZ), '"sShortDate"="C:\\\\Path \\"x\\""'),
+            (("", "default", winreg.REG_SZ), '@="default"'),
+            (("Text", "a\r\nb", winreg.REG_SZ), '"Text"=hex(1):61,00,0d,00,0a,00,62,00,00,00'),
+            (("iDate", 0x1F, winreg.REG_DWORD), '"iDate"=dword:0000001f'),
+            (("Path", "%A%", winreg.REG_EXPAND_SZ), '"Path"=hex(2):25,00,41,00,25,00,00,00'),
+            (("List", ["a", "b"], winreg.REG_MULTI_SZ), '"List"=hex(7):61,00,00,00,62,00,00,00,00,00'),
+            (("Big", 1, winreg.REG_QWORD), '"Big"=hex(b):01,00,00,00,00,00,00,00'),
+            (("Raw", b"\x01\xff", winreg.REG_BINARY), '"Raw"=hex:01,ff')
+        ]
         
-        # Basic consistency check
-        return len(locales["powershell"]) > 0 and len(locales["python"]) > 0 and len(locales["cpp"]) > 0
+        for args, expected in cases:
+            actual = app_module._format_reg_value(*args)
+            if actual != expected:
+                return f"Unexpected .reg line for {args[0] or '@'}: {actual}"
+        
+        return True
     
     def test_backup_directory_creation(self) -> bool:
         """Test backup directory creation"""
+        import tempfile
+        
         try:
-            temp_dir = tempfile.mkdtemp()
-            backup_dir = os.path.join(temp_dir, "test_backup")
-            
-            # Simulate backup directory creation
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            success = os.path.exists(backup_dir)
-            shutil.rmtree(temp_dir)
-            return success
+            with tempfile.TemporaryDirectory() as temp_dir:
+                backup_dir = os.path.join(temp_dir, "test_backup")
+                
+                # Simulate backup directory creation
+                os.makedirs(backup_dir, exist_ok=True)
+                
+                return os.path.isdir(backup_dir)
         except:
             return False
     
@@ -244,54 +346,65 @@ class TestFramework:
         print("🧪 Starting Comprehensive Test Suite")
         print("=" * 50)
         
-        # Core functionality tests
-        self.run_test("PowerShell Syntax Check", self.test_powershell_syntax)
-        self.run_test("PowerShell Execution Policy", self.test_powershell_execution_policy)
-        self.run_test("Python Import Test", self.test_python_imports)
-        self.run_test("Python Demo Mode", self.test_python_demo_mode)
-        self.run_test("C++ Compilation", self.test_cpp_compilation)
-        self.run_test("C++ Demo Execution", self.test_cpp_demo_execution)
-        
-        # Configuration and file tests
-        self.run_test("Configuration File Validity", self.test_config_files_validity)
-        self.run_test("Batch File Syntax", self.test_batch_files_syntax)
-        self.run_test("Locale Consistency", self.test_locale_consistency)
+        tests = [
+            # Core functionality tests
+            ("PowerShell Syntax Check", self.test_powershell_syntax),
+            ("PowerShell Execution Policy", self.test_powershell_execution_policy),
+            ("Python Syntax Check", self.test_python_syntax),
+            ("Python Demo Mode", self.test_python_demo_mode),
+            ("C++ Compilation", self.test_cpp_compilation),
+            ("C++ Demo Execution", self.test_cpp_demo_execution),
+            
+            # Configuration and file tests
+            ("Configuration File Validity", self.test_config_files_validity),
+            ("Batch File Syntax", self.test_batch_files_syntax),
+            ("Locale Consistency", self.test_locale_consistency),
+            
+            # Advanced feature tests
+            ("Registry Value Serializer", self.test_reg_value_serializer),
+            ("Backup Directory Creation", self.test_backup_directory_creation),
+            ("Performance Monitoring", self.test_performance_monitoring),
+        ]
         
-        # Advanced feature tests
-        self.run_test("Backup Directory Creation", self.test_backup_directory_creation)
-        self.run_test("Performance Monitoring", self.test_performance_monitoring)
+        # Tests are independent and mostly wait on subprocesses or file I/O, so
+        # run them concurrently and record the results in submission order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(self._execute_test, name, func) for name, func in tests]
+            for future in futures:
+                self._record_result(*future.result())
         
         # Generate report
         self.generate_report()
     
     def generate_report(self):
         """Generate detailed test report"""
-        print("\n" + "=" * 50)
-        print("📊 TEST RESULTS SUMMARY")
-        print("=" * 50)
-        
-        print(f"Total Tests: {self.total_tests}")
-        print(f"Passed: {self.passed_tests} ✅")
-        print(f"Failed: {self.failed_tests} ❌")
-        
-        success_rate = (self.passed_tests / self.total_tests * 100) if self.total_tests > 0 else 0
-        print(f"Success Rate: {success_rate:.1f}%")
-        
-        total_time = sum(result.execution_time for result in self.results)
-        print(f"Total Execution Time: {total_time:.2f} seconds")
-        
-        if self.failed_tests > 0:
-            print("\n❌ FAILED TESTS:")
+        with _buffered_print():
+            print("\n" + "=" * 50)
+            print("📊 TEST RESULTS SUMMARY")
+            print("=" * 50)
+            
+            print(f"Total Tests: {self.total_tests}")
+            print(f"Passed: {self.passed_tests} ✅")
+            print(f"Failed: {self.failed_tests} ❌")
+            
+            success_rate = (self.passed_tests / self.total_tests * 100) if self.total_tests > 0 else 0
+            print(f"Success Rate: {success_rate:.1f}%")
+            
+            total_time = sum(result.execution_time for result in self.results)
+            print(f"Total Execution Time: {total_time:.2f} seconds")
+            
+            if self.failed_tests > 0:
+                print("\n❌ FAILED TESTS:")
+                for result in self.results:
+                    if not result.passed:
+                        print(f"  • {result.name}: {result.message}")
+            
+            print("\n📈 PERFORMANCE METRICS:")
             for result in self.results:
-                if not result.passed:
-                    print(f"  • {result.name}: {result.message}")
-        
-        print("\n📈 PERFORMANCE METRICS:")
-        for result in self.results:
-            print(f"  • {result.name}: {result.execution_time:.3f}s")
-        
-        # Save detailed report
-        self.save_detailed_report()
+                print(f"  • {result.name}: {result.execution_time:.3f}s")
+            
+            # Save detailed report
+            self.save_detailed_report()
     
     def save_detailed_report(self):
         """Save detailed test report to file"""
@@ -315,8 +428,7 @@ class TestFramework:
         }
         
         try:
-            with open("test_report.json", "w") as f:
-                json.dump(report_data, f, indent=2)
+            Path("test_report.json").write_bytes(_dump_report(report_data))
             print(f"\n📄 Detailed report saved to: test_report.json")
         except Exception as e:
             print(f"\n⚠️  Could not save detailed report: {e}")
@@ -328,7 +440,10 @@ def main():
     print()
     
     framework = TestFramework()
-    framework.run_comprehensive_tests()
+    try:
+        framework.run_comprehensive_tests()
+    finally:
+        framework.close()
     
     # Exit with appropriate code
     sys.exit(0 if framework.failed_tests == 0 else 1)